@@ -7,14 +7,20 @@ Dynamic programming approach to OX with a randomly choosing opponent. The game s
 """
 
 from bots import Bot
+from telemetry import approxMemory, printProgress
+from time import perf_counter
 
 class OXDynamicProgrammingBot(Bot):
-    def __init__(self,name):
+    def __init__(self,name,callback=printProgress,checkpointEvery=None):
+        """callback receives a telemetry event dict per evaluation sweep and improvement round (None to disable).
+        checkpointEvery=n also sends a copy of the policy every n improvement rounds"""
         self.name=name
         self.bound=0.1
         self.stateValues={}
         self.policy={}
         self.actions={}
+        self.callback=callback
+        self.checkpointEvery=checkpointEvery
         self.train()
           
     def promptBot(self,game):
@@ -34,32 +40,51 @@ class OXDynamicProgrammingBot(Bot):
             self.initialiseState(tuple(move))
         self.policyEvaluation()
         i=0
-        while not self.policyImprovement():
-            print("improvement round "+str(i))
+        while True:
+            startTime=perf_counter()
+            changes=self.policyImprovement()
+            if self.callback:
+                self.callback({"event":"improvement","round":i,"policyChanges":changes,
+                               "wallTime":perf_counter()-startTime,"states":len(self.stateValues),
+                               "memory":approxMemory(self.stateValues,self.policy,self.actions)})
+                if self.checkpointEvery and (i+1)%self.checkpointEvery==0:
+                    self.callback({"event":"checkpoint","round":i,"policy":dict(self.policy)})
+            if changes==0:
+                break
             i+=1
             self.policyEvaluation()
             
 
     def policyEvaluation(self):
-        oldLength=len(self.stateValues)
-        delta=0
-        for state in list(self.stateValues.keys()):
-            v=self.stateValues[state]
-            self.stateValues[state]=self.ExpectedReturn(state,self.policy[state])
-            delta=max(delta,abs(v-self.stateValues[state]))
-        print(str(len(self.stateValues))+" states, delta of"+str(delta))
-        if len(self.stateValues) > oldLength or delta>self.bound:
-            self.policyEvaluation()
+        """Sweeps the state values until no new states are found and the max delta is within bound"""
+        sweep=0
+        while True:
+            startTime=perf_counter()
+            oldLength=len(self.stateValues)
+            delta=0
+            for state in list(self.stateValues.keys()):
+                v=self.stateValues[state]
+                self.stateValues[state]=self.ExpectedReturn(state,self.policy[state])
+                delta=max(delta,abs(v-self.stateValues[state]))
+            if self.callback:
+                self.callback({"event":"sweep","sweep":sweep,"states":len(self.stateValues),
+                               "newStates":len(self.stateValues)-oldLength,"delta":delta,
+                               "wallTime":perf_counter()-startTime,
+                               "memory":approxMemory(self.stateValues,self.policy,self.actions)})
+            sweep+=1
+            if not (len(self.stateValues) > oldLength or delta>self.bound):
+                break
     
     def policyImprovement(self):    
-        stable=True
+        """Makes the policy greedy with respect to the state values, returns the number of states changed"""
+        changes=0
         for state in list(self.policy):
             a=self.policy[state]
             possibilities={action: self.ExpectedReturn(state,action) for action in self.actions[state]}
             self.policy[state]=max(possibilities,key=lambda x: possibilities[x])
             if self.policy[state]!=a:
-                stable=False
-        return(stable)
+                changes+=1
+        return(changes)
 
     def obtain(self,dic,state):
         if state not in dic.keys():
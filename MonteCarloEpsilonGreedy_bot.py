@@ -9,6 +9,8 @@ Monte Carlo with epsilon greedy on-policy approach to action exploration. Only t
 
 from bots import Bot
 from random import choices
+from telemetry import approxMemory
+from time import perf_counter
 
 class OXMonteCarloEpsGreedyBot(Bot):
     def __init__(self,name,epsilon):
@@ -51,12 +53,16 @@ class OXMonteCarloEpsGreedyBot(Bot):
 #            move[i]=-1
 #            self.initialiseState(tuple(move))
     
-    def train(self,Game,rewardFn,opponents,repeats):
-        """Repeatedly plays a game and uses the reward values ( terminal) to train the policy"""
+    def train(self,Game,rewardFn,opponents,repeats,callback=None,batchSize=1000,checkpointEvery=None):
+        """Repeatedly plays a game and uses the reward values ( terminal) to train the policy.
+        callback receives a telemetry event dict every batchSize games (and for the final part batch);
+        checkpointEvery=n also sends a copy of the policy every n batches"""
         bots=[self] + opponents
         game=Game(bots)
         self.recordActions=True
         rewards=[]
+        batch=0
+        batchStart=perf_counter()
         for _ in range(repeats):
             self.record=[]
 #            print("about to record training game "+str(_))
@@ -65,6 +71,20 @@ class OXMonteCarloEpsGreedyBot(Bot):
 #            print("reward: "+str(reward))
             rewards.append(reward)
             self.updateBot(reward)
+            if callback and ((_+1)%batchSize==0 or _+1==repeats):
+                batchEnd=perf_counter()
+                batchRewards=rewards[batch*batchSize:]
+                wallTime=batchEnd-batchStart
+                callback({"event":"batch","batch":batch,"episodes":_+1,"wallTime":wallTime,
+                          "episodesPerSec":len(batchRewards)/wallTime if wallTime else float("inf"),
+                          "meanReward":sum(batchRewards)/len(batchRewards),"states":len(self.policy),
+                          "actionValues":len(self.actionValues),
+                          "memory":approxMemory(self.actions,self.policy,self.actionValues,self.sampleSize)})
+                if checkpointEvery and (batch+1)%checkpointEvery==0:
+                    callback({"event":"checkpoint","batch":batch,"episodes":_+1,
+                              "policy":{state:list(weights) for state,weights in self.policy.items()}})
+                batch+=1
+                batchStart=perf_counter()
         return rewards
     
     def updateBot(self,reward):
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:00:00 2026
+Structured training telemetry for the learning bots. Progress is reported as plain dict events passed to a
+callback, so long training runs can be monitored without parsing stdout.
+Every event has an "event" key: "sweep" and "improvement" (dynamic programming), "batch" (Monte Carlo)
+and "checkpoint" (either learner, when checkpointEvery is set).
+@author: terrylines
+"""
+from sys import getsizeof
+from time import perf_counter
+
+def approxMemory(*dics):
+    """Shallow estimate in bytes of the tables: the dicts plus their keys and values"""
+    total=0
+    for dic in dics:
+        total+=getsizeof(dic)
+        for key,value in dic.items():
+            total+=getsizeof(key)+getsizeof(value)
+    return total
+
+def printProgress(event):
+    """Callback reproducing the original progress lines"""
+    if event["event"]=="sweep":
+        print(str(event["states"])+" states, delta of"+str(event["delta"]))
+    elif event["event"]=="improvement" and event["policyChanges"]>0:
+        print("improvement round "+str(event["round"]))
+    elif event["event"]=="batch":
+        print(str(event["episodes"])+" episodes, "+str(round(event["episodesPerSec"]))+" episodes/sec, mean reward "+str(event["meanReward"]))
+
+class TelemetryLog:
+    """Callback that keeps every event, optionally passing it on to another callback"""
+    def __init__(self,callback=None):
+        self.events=[]
+        self.callback=callback
+        self.start=perf_counter()
+
+    def __call__(self,event):
+        event["elapsed"]=perf_counter()-self.start
+        self.events.append(event)
+        if self.callback:
+            self.callback(event)
+
+    def byType(self,kind):
+        return [event for event in self.events if event["event"]==kind]